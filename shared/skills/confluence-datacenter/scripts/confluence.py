@@ -8,40 +8,145 @@ Compatible with Confluence Data Center/Server 6.x and later.
 
 import html
 import json
+import mimetypes
 import os
 import re
+import subprocess
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html.parser import HTMLParser
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
+from urllib.parse import urlparse
 
 import requests
 import typer
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.table import Table
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = typer.Typer(help="Confluence Data Center CLI")
 console = Console()
+err_console = Console(stderr=True)
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "confluence-cli"
+MAX_WORKERS = 16
+POOL_MAXSIZE = 64
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+    raise_on_status=False,
+)
+
+# Fallback markdown -> storage patterns
+_MD_H3 = re.compile(r'^### (.+)$', re.MULTILINE)
+_MD_H2 = re.compile(r'^## (.+)$', re.MULTILINE)
+_MD_H1 = re.compile(r'^# (.+)$', re.MULTILINE)
+_MD_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_MD_ITALIC = re.compile(r'\*(.+?)\*')
+_MD_CODE = re.compile(r'`(.+?)`')
+_MD_LINK = re.compile(r'\[(.+?)\]\((.+?)\)')
+_MD_SIGILS = re.compile(r'[*`\[#]')
+_MD_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+_BLANK_LINES = re.compile(r'\n{3,}')
+_HTML_PRETTY = re.compile(r'>\s+<')
+
+
+def json_loads(data: bytes | str):
+    """Parse JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> SimpleNamespace:
+    """Load connection settings from the environment (and .env) once per process."""
+    load_dotenv()
+    return SimpleNamespace(
+        base_url=os.environ.get("CONFLUENCE_BASE_URL", "").rstrip("/"),
+        pat=os.environ.get("CONFLUENCE_PAT"),
+        username=os.environ.get("CONFLUENCE_USERNAME"),
+        password=os.environ.get("CONFLUENCE_PASSWORD"),
+    )
+
+
+class MultipartFile:
+    """Single-file multipart/form-data body streamed from disk in fixed-size chunks.
+
+    Defining __len__ lets requests send a Content-Length header instead of
+    buffering the whole file the way ``files=`` does.
+    """
+
+    def __init__(self, file_path: Path, field: str = "file", chunk_size: int = 64 * 1024):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        filename = file_path.name.replace('"', "%22")
+        mime_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        self.head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode()
+        self.tail = f"\r\n--{boundary}--\r\n".encode()
+
+    def __len__(self) -> int:
+        return len(self.head) + self.file_path.stat().st_size + len(self.tail)
+
+    def __iter__(self):
+        yield self.head
+        with open(self.file_path, "rb") as f:
+            while chunk := f.read(self.chunk_size):
+                yield chunk
+        yield self.tail
 
 
 class ConfluenceClient:
     """Confluence Data Center API client."""
 
-    def __init__(self):
-        load_dotenv()
+    def __init__(self, use_cache: bool = True):
+        config = get_config()
 
-        self.base_url = os.environ.get("CONFLUENCE_BASE_URL", "").rstrip("/")
+        self.base_url = config.base_url
         if not self.base_url:
             raise typer.BadParameter("CONFLUENCE_BASE_URL environment variable required")
 
         self.api_url = f"{self.base_url}/rest/api"
+        use_cache = use_cache and bool(os.environ.get("CONFLUENCE_CACHE"))
+        self.cache_dir = CACHE_DIR / urlparse(self.base_url).netloc if use_cache else None
+        self._page_cache: dict[str, dict] = {}
 
-        pat = os.environ.get("CONFLUENCE_PAT")
+        pat = config.pat
         if pat:
             self.session = requests.Session()
             self.session.headers["Authorization"] = f"Bearer {pat}"
         else:
-            username = os.environ.get("CONFLUENCE_USERNAME")
-            password = os.environ.get("CONFLUENCE_PASSWORD")
+            username = config.username
+            password = config.password
             if not username or not password:
                 raise typer.BadParameter(
                     "Set CONFLUENCE_PAT or both CONFLUENCE_USERNAME and CONFLUENCE_PASSWORD"
@@ -52,6 +157,10 @@ class ConfluenceClient:
         self.session.headers["Content-Type"] = "application/json"
         self.session.headers["Accept"] = "application/json"
 
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _request(self, method: str, endpoint: str, **kwargs) -> dict | list | None:
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
 
@@ -61,9 +170,12 @@ class ConfluenceClient:
 
             if response.status_code == 204:
                 return None
-            if response.headers.get("Content-Type", "").startswith("application/json"):
-                return response.json()
-            return {"content": response.text}
+            elif response.headers.get("Content-Type", "").startswith("application/json"):
+                return json_loads(response.content)
+            else:
+                # Decode with the declared charset; response.text would run charset detection
+                encoding = response.encoding or "utf-8"
+                return {"content": response.content.decode(encoding, errors="replace")}
 
         except requests.exceptions.HTTPError as e:
             error_msg = str(e)
@@ -82,17 +194,65 @@ class ConfluenceClient:
         if "Authorization" in self.session.headers:
             headers["Authorization"] = self.session.headers["Authorization"]
 
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f)}
-            response = self.session.post(url, files=files, headers=headers, auth=self.session.auth)
-            response.raise_for_status()
-            return response.json()
+        body = MultipartFile(file_path)
+        headers["Content-Type"] = body.content_type
+        response = self.session.post(url, data=body, headers=headers, auth=self.session.auth)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def _cache_path(self, page_id: str) -> Path | None:
+        if self.cache_dir is None or not page_id.isdigit():
+            return None
+        return self.cache_dir / f"{page_id}.json"
+
+    def _invalidate(self, page_id: str) -> None:
+        self._page_cache.pop(page_id, None)
+        cache_path = self._cache_path(page_id)
+        if cache_path:
+            cache_path.unlink(missing_ok=True)
+
+    def _get_page_by_id(self, page_id: str) -> dict:
+        """Fetch a page, reusing the cached copy if its version is still current."""
+        if page_id in self._page_cache:
+            return self._page_cache[page_id]
+
+        cache_path = self._cache_path(page_id)
+        if cache_path and cache_path.exists():
+            try:
+                cached = json_loads(cache_path.read_bytes())
+            except (OSError, ValueError):
+                cached = None
+            if cached:
+                meta = self._request("GET", f"content/{page_id}", params={"expand": "version"})
+                if meta.get("version", {}).get("number") == cached.get("version", {}).get("number"):
+                    self._page_cache[page_id] = cached
+                    return cached
+
+        params = {"expand": "body.storage,version,space,ancestors"}
+        page = self._request("GET", f"content/{page_id}", params=params)
+        self._page_cache[page_id] = page
+        if cache_path:
+            try:
+                self._write_cache(cache_path, page)
+            except OSError:
+                pass
+        return page
+
+    @staticmethod
+    def _write_cache(cache_path: Path, page: dict) -> None:
+        """Write a cache entry readable only by the current user."""
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(cache_path.parent, 0o700)
+        tmp_path = cache_path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json_dumps(page))
+        os.replace(tmp_path, cache_path)
 
     def get_page(self, page_id: str | None = None, space_key: str | None = None,
                  title: str | None = None) -> dict:
         if page_id:
-            params = {"expand": "body.storage,version,space,ancestors"}
-            return self._request("GET", f"content/{page_id}", params=params)
+            return self._get_page_by_id(page_id)
         elif space_key and title:
             params = {"spaceKey": space_key, "title": title, "expand": "body.storage,version,space"}
             result = self._request("GET", "content", params=params)
@@ -103,8 +263,49 @@ class ConfluenceClient:
         else:
             raise typer.BadParameter("Provide page_id or both --space and --title")
 
-    def search(self, cql: str, max_results: int = 25, content_type: str | None = None) -> dict:
-        params = {"cql": cql, "limit": max_results, "expand": "space,version"}
+    def get_pages(self, page_ids: list[str],
+                  max_workers: int = MAX_WORKERS) -> tuple[list[dict], list[str]]:
+        """Fetch several pages concurrently, preserving the order of page_ids.
+
+        Returns (pages, failed_ids); one missing or forbidden page does not
+        discard the others.
+        """
+        if not page_ids:
+            return [], []
+
+        def fetch(page_id: str) -> dict | None:
+            try:
+                return self.get_page(page_id)
+            except typer.Exit:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(page_ids))) as executor:
+            results = list(executor.map(fetch, page_ids))
+        pages = [page for page in results if page is not None]
+        failed = [pid for pid, page in zip(page_ids, results) if page is None]
+        return pages, failed
+
+    def get_pages_bulk(self, page_ids: list[str], batch_size: int = 50) -> list[dict]:
+        """Fetch pages with one CQL search per batch of IDs, in the order given.
+
+        Results come from the search index, so edits made seconds ago may not show yet.
+        """
+        invalid = [pid for pid in page_ids if not pid.isdigit()]
+        if invalid:
+            raise typer.BadParameter(f"Invalid page ID: {invalid[0]}")
+
+        found = {}
+        for start in range(0, len(page_ids), batch_size):
+            batch = page_ids[start:start + batch_size]
+            result = self.search(f"id in ({','.join(batch)})", max_results=len(batch),
+                                 expand="body.storage,version,space")
+            for item in result.get("results", []):
+                found[item.get("id")] = item
+        return [found[pid] for pid in page_ids if pid in found]
+
+    def search(self, cql: str, max_results: int = 25, content_type: str | None = None,
+               expand: str = "space,version") -> dict:
+        params = {"cql": cql, "limit": max_results, "expand": expand}
         if content_type:
             params["cql"] = f"type = {content_type} AND ({cql})"
         return self._request("GET", "content/search", params=params)
@@ -133,14 +334,19 @@ class ConfluenceClient:
         }
         if body:
             data["body"] = {body_format: {"value": body, "representation": body_format}}
-        return self._request("PUT", f"content/{page_id}", json=data)
+        result = self._request("PUT", f"content/{page_id}", json=data)
+        self._invalidate(page_id)
+        return result
 
     def delete_page(self, page_id: str) -> None:
         self._request("DELETE", f"content/{page_id}")
+        self._invalidate(page_id)
 
-    def get_children(self, page_id: str, max_results: int = 50) -> dict:
-        return self._request("GET", f"content/{page_id}/child/page",
-                           params={"expand": "version", "limit": max_results})
+    def get_children(self, page_id: str, max_results: int = 50, expand: str = "version") -> dict:
+        params = {"limit": max_results}
+        if expand:
+            params["expand"] = expand
+        return self._request("GET", f"content/{page_id}/child/page", params=params)
 
     def get_spaces(self, space_type: str | None = None) -> dict:
         params = {"limit": 100, "expand": "description.plain"}
@@ -154,17 +360,49 @@ class ConfluenceClient:
     def upload_attachment(self, page_id: str, file_path: Path) -> dict:
         return self._upload(f"content/{page_id}/child/attachment", file_path)
 
-    def export_pdf(self, page_id: str) -> bytes:
+    def export_pdf(self, page_id: str, dest: Path) -> None:
         url = f"{self.base_url}/spaces/flyingpdf/pdfpageexport.action"
-        response = self.session.get(url, params={"pageId": page_id})
+        with self.session.get(url, params={"pageId": page_id}, stream=True) as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+
+
+@lru_cache(maxsize=1)
+def get_pandoc_session() -> requests.Session:
+    """Return a shared session so repeated conversions reuse one connection."""
+    return requests.Session()
+
+
+def pandoc_server_convert(text: str, from_format: str, to_format: str) -> str | None:
+    """Convert text via a long-running `pandoc server` at PANDOC_SERVER_URL, if set."""
+    url = os.environ.get("PANDOC_SERVER_URL")
+    if not url:
+        return None
+    try:
+        response = get_pandoc_session().post(
+            url,
+            json={"text": text, "from": from_format, "to": to_format},
+            headers={"Accept": "application/json"},
+            timeout=30,
+        )
         response.raise_for_status()
-        return response.content
+        result = response.json()
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+    if "error" in result:
+        return None
+    return result.get("output")
 
 
 def markdown_to_storage(markdown: str) -> str:
     """Convert markdown to Confluence storage format."""
+    converted = pandoc_server_convert(markdown, "markdown", "html")
+    if converted is not None:
+        return converted
+
     try:
-        import subprocess
         result = subprocess.run(
             ["pandoc", "-f", "markdown", "-t", "html"],
             input=markdown, capture_output=True, text=True, timeout=30
@@ -174,57 +412,123 @@ def markdown_to_storage(markdown: str) -> str:
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
 
+    # Fallback: plain text without markdown syntax only needs paragraphs
+    if not _MD_SIGILS.search(markdown):
+        paragraphs = (p.strip() for p in _MD_PARAGRAPH_BREAK.split(markdown))
+        return "\n".join(f"<p>{html.escape(p)}</p>" for p in paragraphs if p)
+
     # Fallback: basic conversion
     text = markdown
-    text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-    text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-    text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-    text = re.sub(r'`(.+?)`', r'<code>\1</code>', text)
-    text = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', text)
+    text = _MD_H3.sub(r'<h3>\1</h3>', text)
+    text = _MD_H2.sub(r'<h2>\1</h2>', text)
+    text = _MD_H1.sub(r'<h1>\1</h1>', text)
+    text = _MD_BOLD.sub(r'<strong>\1</strong>', text)
+    text = _MD_ITALIC.sub(r'<em>\1</em>', text)
+    text = _MD_CODE.sub(r'<code>\1</code>', text)
+    text = _MD_LINK.sub(r'<a href="\2">\1</a>', text)
     return text
 
 
+class _StorageToMarkdown(HTMLParser):
+    """Single-pass storage format to markdown converter used when markitdown is missing."""
+
+    HEADINGS = {"h1": "# ", "h2": "## ", "h3": "### ", "h4": "#### ", "h5": "##### ", "h6": "###### "}
+    INLINE = {"strong": "**", "b": "**", "em": "*", "i": "*", "code": "`"}
+    BLOCKS = {"p", "ul", "ol", "table", "tr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out: list[str] = []
+        self.hrefs: list[str | None] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HEADINGS:
+            self.out.append(self.HEADINGS[tag])
+        elif tag in self.INLINE:
+            self.out.append(self.INLINE[tag])
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            self.hrefs.append(href)
+            if href:
+                self.out.append("[")
+        elif tag == "li":
+            self.out.append("- ")
+        elif tag == "br":
+            self.out.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.HEADINGS or tag in self.BLOCKS:
+            self.out.append("\n\n")
+        elif tag in self.INLINE:
+            self.out.append(self.INLINE[tag])
+        elif tag == "a":
+            href = self.hrefs.pop() if self.hrefs else None
+            if href:
+                self.out.append(f"]({href})")
+        elif tag == "li":
+            self.out.append("\n")
+
+    def handle_data(self, data):
+        self.out.append(data)
+
+    def markdown(self) -> str:
+        return _BLANK_LINES.sub("\n\n", "".join(self.out)).strip()
+
+
+@lru_cache(maxsize=1)
+def get_markitdown():
+    """Return a shared MarkItDown instance (raises ImportError if not installed)."""
+    from markitdown import MarkItDown
+    return MarkItDown()
+
+
 def storage_to_markdown(storage: str) -> str:
     """Convert Confluence storage format to markdown."""
     try:
-        from markitdown import MarkItDown
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".html", mode="w", delete=False) as f:
-            f.write(storage)
-            f.flush()
-            md = MarkItDown()
-            result = md.convert(f.name)
-            Path(f.name).unlink()
-            return result.text_content
+        md = get_markitdown()
     except ImportError:
-        pass
+        md = None
+    if md is not None:
+        stream = BytesIO(storage.encode("utf-8"))
+        return md.convert_stream(stream, file_extension=".html").text_content
 
     # Fallback
-    text = storage
-    text = re.sub(r'<h1[^>]*>(.+?)</h1>', r'# \1', text)
-    text = re.sub(r'<h2[^>]*>(.+?)</h2>', r'## \1', text)
-    text = re.sub(r'<h3[^>]*>(.+?)</h3>', r'### \1', text)
-    text = re.sub(r'<strong>(.+?)</strong>', r'**\1**', text)
-    text = re.sub(r'<em>(.+?)</em>', r'*\1*', text)
-    text = re.sub(r'<code>(.+?)</code>', r'`\1`', text)
-    text = re.sub(r'<a[^>]*href="([^"]+)"[^>]*>(.+?)</a>', r'[\2](\1)', text)
-    text = re.sub(r'<li>(.+?)</li>', r'- \1', text)
-    text = re.sub(r'</?[uo]l[^>]*>', '', text)
-    text = re.sub(r'<p>(.+?)</p>', r'\1\n\n', text)
-    text = re.sub(r'<[^>]+>', '', text)
-    return html.unescape(text).strip()
-
-
-def get_client() -> ConfluenceClient:
+    parser = _StorageToMarkdown()
+    parser.feed(storage)
+    parser.close()
+    return parser.markdown()
+
+
+def get_client(use_cache: bool = True) -> ConfluenceClient:
     try:
-        return ConfluenceClient()
+        return ConfluenceClient(use_cache=use_cache)
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
+def print_page(client: ConfluenceClient, page: dict, output_format: str) -> None:
+    pid = page.get("id", "")
+    ptitle = page.get("title", "")
+    pspace = page.get("space", {}).get("key", "")
+
+    console.print(f"\n[bold blue]{ptitle}[/bold blue]")
+    console.print(f"ID: {pid}  Space: {pspace}")
+    console.print(f"URL: {client.base_url}/pages/viewpage.action?pageId={pid}\n")
+
+    body = page.get("body", {}).get("storage", {}).get("value", "")
+    if output_format == "markdown":
+        body = storage_to_markdown(body)
+    elif output_format == "html":
+        body = _HTML_PRETTY.sub('>\n<', body)
+
+    if console.is_terminal:
+        console.print(body)
+    else:
+        # Piped output: skip rich's markup parsing and wrapping
+        sys.stdout.write(body + "\n")
+
+
 @app.command("get")
 def get_page(
     page_id: Optional[str] = typer.Argument(None, help="Page ID"),
@@ -233,9 +537,10 @@ def get_page(
     output_format: str = typer.Option("markdown", "--format", "-f",
                                        help="Output format: markdown, html, storage"),
     output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local page cache"),
 ):
     """Get page content by ID or title."""
-    client = get_client()
+    client = get_client(use_cache=not no_cache)
 
     if not page_id and not (space and title):
         console.print("[red]Error:[/red] Provide page_id or both --space and --title")
@@ -244,24 +549,60 @@ def get_page(
     page = client.get_page(page_id=page_id, space_key=space, title=title)
 
     if output_json:
-        console.print_json(json.dumps(page))
+        console.print_json(json_dumps(page))
         return
 
-    pid = page.get("id", "")
-    ptitle = page.get("title", "")
-    pspace = page.get("space", {}).get("key", "")
+    print_page(client, page, output_format)
 
-    console.print(f"\n[bold blue]{ptitle}[/bold blue]")
-    console.print(f"ID: {pid}  Space: {pspace}")
-    console.print(f"URL: {client.base_url}/pages/viewpage.action?pageId={pid}\n")
 
-    body = page.get("body", {}).get("storage", {}).get("value", "")
-    if output_format == "markdown":
-        console.print(storage_to_markdown(body))
-    elif output_format == "html":
-        console.print(re.sub(r'>\s+<', '>\n<', body))
+@app.command("get-many")
+def get_many(
+    page_ids: list[str] = typer.Argument(..., help="Page IDs"),
+    output_format: str = typer.Option("markdown", "--format", "-f",
+                                       help="Output format: markdown, html, storage"),
+    workers: int = typer.Option(MAX_WORKERS, "--workers", "-w", help="Concurrent requests"),
+    output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local page cache"),
+):
+    """Get several pages by ID, fetched concurrently."""
+    client = get_client(use_cache=not no_cache)
+    pages, failed = client.get_pages(page_ids, max_workers=max(1, workers))
+
+    if output_json:
+        console.print_json(json_dumps(pages))
     else:
-        console.print(body)
+        for page in pages:
+            print_page(client, page, output_format)
+
+    if failed:
+        typer.echo(f"Failed: {', '.join(failed)}", err=True)
+        raise typer.Exit(1)
+
+
+@app.command("get-bulk")
+def get_bulk(
+    page_ids: list[str] = typer.Argument(..., help="Page IDs"),
+    output_format: str = typer.Option("markdown", "--format", "-f",
+                                       help="Output format: markdown, html, storage"),
+    batch_size: int = typer.Option(50, "--batch", "-b", help="Page IDs per CQL search"),
+    output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """Get several pages by ID using batched CQL searches."""
+    client = get_client()
+    pages = client.get_pages_bulk(page_ids, batch_size=max(1, batch_size))
+
+    found = {page.get("id") for page in pages}
+    missing = [page_id for page_id in dict.fromkeys(page_ids) if page_id not in found]
+
+    if output_json:
+        console.print_json(json_dumps(pages))
+    else:
+        for page in pages:
+            print_page(client, page, output_format)
+
+    if missing:
+        err_console.print(f"[yellow]Not found:[/yellow] {', '.join(missing)}")
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -274,10 +615,12 @@ def search(
 ):
     """Search content using CQL."""
     client = get_client()
-    results = client.search(cql, max_results=max_results, content_type=content_type)
+    # The table only shows id, space, title and type; skip expanding versions for it
+    expand = "space,version" if output_json else "space"
+    results = client.search(cql, max_results=max_results, content_type=content_type, expand=expand)
 
     if output_json:
-        console.print_json(json.dumps(results))
+        console.print_json(json_dumps(results))
         return
 
     items = results.get("results", [])
@@ -332,7 +675,7 @@ def create(
     result = client.create_page(space, title, content, parent_id=parent, body_format=body_format)
 
     if output_json:
-        console.print_json(json.dumps(result))
+        console.print_json(json_dumps(result))
         return
 
     pid = result.get("id", "")
@@ -394,10 +737,10 @@ def children(
 ):
     """List child pages."""
     client = get_client()
-    result = client.get_children(page_id)
+    result = client.get_children(page_id, expand="version" if output_json else "")
 
     if output_json:
-        console.print_json(json.dumps(result))
+        console.print_json(json_dumps(result))
         return
 
     items = result.get("results", [])
@@ -418,7 +761,7 @@ def spaces(
     result = client.get_spaces(space_type=space_type)
 
     if output_json:
-        console.print_json(json.dumps(result))
+        console.print_json(json_dumps(result))
         return
 
     items = result.get("results", [])
@@ -452,7 +795,7 @@ def attachments(
         result = client.upload_attachment(page_id, upload)
 
         if output_json:
-            console.print_json(json.dumps(result))
+            console.print_json(json_dumps(result))
         else:
             console.print(f"[green]Uploaded:[/green] {upload.name}")
         return
@@ -460,7 +803,7 @@ def attachments(
     result = client.get_attachments(page_id)
 
     if output_json:
-        console.print_json(json.dumps(result))
+        console.print_json(json_dumps(result))
         return
 
     items = result.get("results", [])
@@ -477,13 +820,13 @@ def export_page(
     output_format: str = typer.Option("markdown", "--format", "-f",
                                        help="Export format: pdf, markdown"),
     output: Path = typer.Option(..., "--output", "-o", help="Output file path"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local page cache"),
 ):
     """Export page to file."""
-    client = get_client()
+    client = get_client(use_cache=not no_cache)
 
     if output_format == "pdf":
-        content = client.export_pdf(page_id)
-        output.write_bytes(content)
+        client.export_pdf(page_id, output)
         console.print(f"[green]Exported to:[/green] {output}")
 
     elif output_format == "markdown":
@@ -7,15 +7,16 @@ Uses markitdown as primary converter, pandoc as fallback.
 """
 
 import argparse
+import base64
 import os
 import re
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 
-from markitdown import MarkItDown
-
 
 # Formats best handled by pandoc
 PANDOC_FORMATS = {".epub", ".org", ".rst", ".tex", ".latex", ".odt", ".rtf"}
@@ -23,9 +24,67 @@ PANDOC_FORMATS = {".epub", ".org", ".rst", ".tex", ".latex", ".odt", ".rtf"}
 # Formats markitdown handles well
 MARKITDOWN_FORMATS = {".pdf", ".docx", ".pptx", ".xlsx", ".html", ".htm", ".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
+# Input formats `pandoc server` needs spelled out, since it cannot sniff file extensions
+PANDOC_SERVER_FORMATS = {
+    ".epub": "epub", ".org": "org", ".rst": "rst", ".tex": "latex", ".latex": "latex",
+    ".odt": "odt", ".rtf": "rtf", ".docx": "docx", ".html": "html", ".htm": "html",
+}
+
+# Binary input formats are sent to `pandoc server` base64-encoded
+PANDOC_BINARY_FORMATS = {"epub", "odt", "docx"}
+
+# Google Docs URL patterns capturing the document ID
+GDOC_ID_PATTERNS = [
+    re.compile(r'/document/d/([a-zA-Z0-9_-]+)'),
+    re.compile(r'id=([a-zA-Z0-9_-]+)'),
+]
+
+
+@lru_cache(maxsize=1)
+def get_http_session():
+    """Return a shared requests session; imported lazily so local-only runs skip it."""
+    import requests
+    return requests.Session()
+
+
+def run_pandoc_server(input_path: Path) -> str | None:
+    """Convert a file via a long-running `pandoc server` at PANDOC_SERVER_URL, if set."""
+    url = os.environ.get("PANDOC_SERVER_URL")
+    from_format = PANDOC_SERVER_FORMATS.get(input_path.suffix.lower())
+    if not url or not from_format:
+        return None
+
+    if from_format in PANDOC_BINARY_FORMATS:
+        text = base64.b64encode(input_path.read_bytes()).decode("ascii")
+    else:
+        text = input_path.read_text(errors="replace")
+
+    import requests
+    try:
+        response = get_http_session().post(
+            url,
+            json={"text": text, "from": from_format, "to": "markdown"},
+            headers={"Accept": "application/json"},
+            timeout=120,
+        )
+        response.raise_for_status()
+        result = response.json()
+    except (requests.RequestException, ValueError) as e:
+        print(f"Pandoc server unavailable, falling back to pandoc: {e}", file=sys.stderr)
+        return None
+
+    if "error" in result:
+        print(f"Pandoc server warning: {result['error']}", file=sys.stderr)
+        return None
+    return result.get("output")
+
 
 def run_pandoc(input_path: Path) -> str | None:
     """Run pandoc to convert a file to markdown."""
+    content = run_pandoc_server(input_path)
+    if content is not None:
+        return content
+
     try:
         result = subprocess.run(
             ["pandoc", "-t", "markdown", "-o", "-", str(input_path)],
@@ -45,10 +104,17 @@ def run_pandoc(input_path: Path) -> str | None:
         return None
 
 
+@lru_cache(maxsize=2)
+def get_markitdown(enable_vision: bool):
+    """Return a shared MarkItDown instance; imported lazily so pandoc-only runs skip it."""
+    from markitdown import MarkItDown
+    return MarkItDown(enable_vision=enable_vision)
+
+
 def run_markitdown(input_path: Path, enable_ocr: bool = False) -> str | None:
     """Run markitdown to convert a file to markdown."""
     try:
-        md = MarkItDown(enable_vision=enable_ocr)
+        md = get_markitdown(enable_ocr)
         result = md.convert(str(input_path))
         return result.text_content
     except Exception as e:
@@ -72,6 +138,19 @@ def extract_text_pdftotext(input_path: Path) -> str | None:
         return None
 
 
+def extract_pdf_text(input_path: Path) -> str | None:
+    """Extract PDF text with pdftotext, falling back to markitdown if it is missing or finds nothing."""
+    content = extract_text_pdftotext(input_path)
+    if content and content.strip():
+        return content
+    return run_markitdown(input_path, enable_ocr=False)
+
+
+def _content_len(text: str) -> int:
+    """Number of characters in text that are not ASCII whitespace, counted without copying."""
+    return len(text) - sum(text.count(c) for c in " \t\n\r\x0b\x0c")
+
+
 def merge_extractions(text_content: str | None, ocr_content: str | None) -> str:
     """Merge text and OCR extractions intelligently."""
     if not text_content and not ocr_content:
@@ -82,9 +161,10 @@ def merge_extractions(text_content: str | None, ocr_content: str | None) -> str:
         return text_content
 
     # If OCR content is significantly longer, it likely caught more content
-    # (images, scanned pages, etc.)
-    text_len = len(text_content.strip())
-    ocr_len = len(ocr_content.strip())
+    # (images, scanned pages, etc.). Count non-whitespace characters only:
+    # `pdftotext -layout` pads columns with spaces, which would inflate text_len.
+    text_len = _content_len(text_content)
+    ocr_len = _content_len(ocr_content)
 
     # If they're similar, prefer text extraction (cleaner formatting)
     if ocr_len <= text_len * 1.2:
@@ -98,14 +178,9 @@ def merge_extractions(text_content: str | None, ocr_content: str | None) -> str:
 def download_gdoc(url: str, output_dir: Path) -> Path | None:
     """Download a Google Doc as docx for conversion."""
     # Extract document ID from URL
-    patterns = [
-        r'/document/d/([a-zA-Z0-9_-]+)',
-        r'id=([a-zA-Z0-9_-]+)',
-    ]
-
     doc_id = None
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in GDOC_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             doc_id = match.group(1)
             break
@@ -119,16 +194,16 @@ def download_gdoc(url: str, output_dir: Path) -> Path | None:
 
     output_path = output_dir / f"gdoc_{doc_id}.docx"
 
+    import requests
     try:
-        # Try using curl
-        result = subprocess.run(
-            ["curl", "-L", "-o", str(output_path), export_url],
-            capture_output=True,
-            timeout=60,
-        )
-        if result.returncode == 0 and output_path.exists() and output_path.stat().st_size > 0:
+        with get_http_session().get(export_url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            with open(output_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+        if output_path.stat().st_size > 0:
             return output_path
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    except (requests.RequestException, OSError):
         pass
 
     print("Could not download Google Doc. Make sure the document is publicly accessible.", file=sys.stderr)
@@ -207,13 +282,17 @@ def convert_file_content(path: Path, mode: str, hybrid: bool) -> str:
     # PDF with hybrid mode
     if suffix == ".pdf" and hybrid:
         print("Running hybrid extraction (text + OCR)...", file=sys.stderr)
-        text_content = run_markitdown(path, enable_ocr=False)
-        ocr_content = run_markitdown(path, enable_ocr=True)
-        return merge_extractions(text_content, ocr_content)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            text_future = executor.submit(extract_pdf_text, path)
+            ocr_future = executor.submit(run_markitdown, path, enable_ocr=True)
+            return merge_extractions(text_future.result(), ocr_future.result())
 
     # Standard markitdown conversion
     enable_ocr = mode == "ocr" or (mode == "auto" and suffix in {".jpg", ".jpeg", ".png", ".gif", ".webp"})
-    content = run_markitdown(path, enable_ocr=enable_ocr)
+    if suffix == ".pdf" and not enable_ocr:
+        content = extract_pdf_text(path)
+    else:
+        content = run_markitdown(path, enable_ocr=enable_ocr)
 
     if content:
         return content
@@ -226,13 +305,56 @@ def convert_file_content(path: Path, mode: str, hybrid: bool) -> str:
     raise RuntimeError(f"Failed to convert {path}")
 
 
+def convert_files(
+    input_paths: list[str],
+    jobs: int,
+    output_path: str | None = None,
+    mode: str = "auto",
+    hybrid: bool = False,
+) -> int:
+    """
+    Convert several documents, in parallel worker processes when jobs > 1.
+
+    Returns:
+        Number of inputs that failed to convert
+    """
+    convert = partial(convert_file, output_path=output_path, mode=mode, hybrid=hybrid)
+    jobs = min(jobs, len(input_paths))
+    failed = 0
+
+    if jobs <= 1:
+        for input_path in input_paths:
+            try:
+                convert(input_path)
+            except Exception as e:
+                print(f"Error: {input_path}: {e}", file=sys.stderr)
+                failed += 1
+        return failed
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(convert, input_path): input_path for input_path in input_paths}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error: {futures[future]}: {e}", file=sys.stderr)
+                failed += 1
+    return failed
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert documents to Markdown",
         epilog="Supports: PDF, DOCX, PPTX, XLSX, HTML, EPUB, images, Google Docs URLs"
     )
-    parser.add_argument("input", help="Path to file or Google Docs URL")
+    parser.add_argument("input", nargs="+", help="Paths to files or Google Docs URLs")
     parser.add_argument("-o", "--output", help="Output path (default: same location as input with .md extension)")
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to convert in parallel (default: CPU count)"
+    )
     parser.add_argument(
         "--mode",
         choices=["auto", "ocr", "text"],
@@ -247,17 +369,17 @@ def main():
 
     args = parser.parse_args()
 
-    try:
-        convert_file(
-            input_path=args.input,
-            output_path=args.output,
-            mode=args.mode,
-            hybrid=args.hybrid,
-        )
-        return 0
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+    if args.output and len(args.input) > 1:
+        parser.error("--output can only be used with a single input")
+
+    failed = convert_files(
+        args.input,
+        jobs=args.jobs,
+        output_path=args.output,
+        mode=args.mode,
+        hybrid=args.hybrid,
+    )
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
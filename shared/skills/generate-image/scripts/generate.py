@@ -8,6 +8,8 @@ Auth: GOOGLE_APPLICATION_CREDENTIALS env var pointing to service account JSON
 
 import argparse
 import base64
+import binascii
+import functools
 import mimetypes
 import os
 import sys
@@ -19,32 +21,63 @@ from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 
+load_dotenv(override=True)
+
+# Input images at these URIs are passed to the model by reference
+REMOTE_IMAGE_SCHEMES = ("gs://", "https://")
+
+# Common image types, resolved without loading the system mime.types database
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
 
 def load_image_as_part(image_path: str) -> types.Part:
     """Load an image file and return it as a Gemini Part.
 
     Args:
-        image_path: Path to the image file
+        image_path: Path to the image file, or a gs:// or https:// URI
 
     Returns:
-        types.Part containing the image data
+        types.Part containing the image data, or referencing the URI
     """
     path = Path(image_path)
-    if not path.exists():
+    is_uri = image_path.startswith(REMOTE_IMAGE_SCHEMES)
+    if not is_uri and not path.exists():
         raise FileNotFoundError(f"Image not found: {image_path}")
 
     # Determine mime type
-    mime_type, _ = mimetypes.guess_type(str(path))
+    mime_type = IMAGE_MIME_TYPES.get(path.suffix.lower())
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(str(path))
     if mime_type is None:
         # Default to png if we can't determine
         mime_type = "image/png"
 
+    # Remote images are fetched by the service; nothing to read locally
+    if is_uri:
+        return types.Part.from_uri(file_uri=image_path, mime_type=mime_type)
+
     # Read and encode image
     image_bytes = path.read_bytes()
 
     return types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
 
 
+@functools.lru_cache(maxsize=4)
+def get_genai_client(project: str) -> genai.Client:
+    """Return a Vertex AI client for the project, reused across calls."""
+    return genai.Client(
+        vertexai=True,
+        project=project,
+        location="global",
+    )
+
+
 def generate_image(
     prompt: str,
     input_image: str | None = None,
@@ -64,8 +97,6 @@ def generate_image(
     Returns:
         Path to the saved image file
     """
-    load_dotenv(override=True)
-
     project = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get(
         "CLOUDSDK_CORE_PROJECT"
     )
@@ -74,11 +105,7 @@ def generate_image(
             "GOOGLE_CLOUD_PROJECT or CLOUDSDK_CORE_PROJECT env var required"
         )
 
-    client = genai.Client(
-        vertexai=True,
-        project=project,
-        location="global",
-    )
+    client = get_genai_client(project)
 
     model = "gemini-3.1-flash-image-preview"  # Image generation model
 
@@ -142,26 +169,34 @@ def generate_image(
                     elif mime_type == "image/webp":
                         ext = ".webp"
 
-                    # Determine output path
+                    # Decode
+                    if isinstance(image_data, (bytes, bytearray, memoryview)):
+                        image_bytes = image_data
+                    else:
+                        # Strict decode first; only fall back to the forgiving
+                        # decoder (which skips stray whitespace) if that fails
+                        try:
+                            image_bytes = base64.b64decode(image_data, validate=True)
+                        except binascii.Error:
+                            image_bytes = base64.b64decode(image_data)
+
+                    # Determine output path and save
                     if output_path:
                         save_path = Path(output_path)
                         if save_path.suffix == "":
                             save_path = save_path.with_suffix(ext)
+                        save_path.parent.mkdir(parents=True, exist_ok=True)
+                        f = open(save_path, "wb")
                     else:
+                        # Write through the descriptor mkstemp already opened
                         fd, temp_path = tempfile.mkstemp(
                             suffix=ext, prefix="gemini_image_"
                         )
-                        os.close(fd)
                         save_path = Path(temp_path)
+                        f = os.fdopen(fd, "wb")
 
-                    # Decode and save
-                    if isinstance(image_data, str):
-                        image_bytes = base64.b64decode(image_data)
-                    else:
-                        image_bytes = image_data
-
-                    save_path.parent.mkdir(parents=True, exist_ok=True)
-                    save_path.write_bytes(image_bytes)
+                    with f:
+                        f.write(image_bytes)
 
                     print(f"Image saved to: {save_path.absolute()}")
                     return str(save_path.absolute())
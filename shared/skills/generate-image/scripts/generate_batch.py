@@ -1,6 +1,7 @@
 # /// script
 # requires-python = ">=3.10"
 # dependencies = [
+#     "google-cloud-storage",
 #     "google-genai",
 #     "python-dotenv",
 #     "typer",
@@ -14,14 +15,18 @@ Usage:
     uv run generate_batch.py "A sunset over mountains" "A robot in a garden"
     uv run generate_batch.py --from-file prompts.txt -o ./images
     uv run generate_batch.py --max-concurrent 2 "prompt1" "prompt2" "prompt3"
+    uv run generate_batch.py --batch-gcs gs://my-bucket/gemini -f prompts.txt -o ./images
 """
 
 import asyncio
 import base64
+import binascii
+import json
 import mimetypes
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 import typer
@@ -29,6 +34,31 @@ from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 
+load_dotenv(override=True)
+
+MODEL = "gemini-3.1-flash-image-preview"
+
+# Batch jobs that end in any of these states will not produce more output
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Input images at these URIs are passed to the model by reference
+REMOTE_IMAGE_SCHEMES = ("gs://", "https://")
+
+# Common image types, resolved without loading the system mime.types database
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
 app = typer.Typer(help="Generate multiple images in parallel using Gemini.")
 
 
@@ -54,14 +84,45 @@ def _build_config(aspect_ratio: str, image_size: str) -> types.GenerateContentCo
 
 def _load_image_as_part(image_path: str) -> types.Part:
     path = Path(image_path)
-    if not path.exists():
+    is_uri = image_path.startswith(REMOTE_IMAGE_SCHEMES)
+    if not is_uri and not path.exists():
         raise FileNotFoundError(f"Image not found: {image_path}")
-    mime_type, _ = mimetypes.guess_type(str(path))
+    mime_type = IMAGE_MIME_TYPES.get(path.suffix.lower())
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(str(path))
     if mime_type is None:
         mime_type = "image/png"
+    if is_uri:
+        return types.Part.from_uri(file_uri=image_path, mime_type=mime_type)
     return types.Part.from_bytes(data=path.read_bytes(), mime_type=mime_type)
 
 
+def _save_inline_image(image_data: bytes | str, mime_type: str | None, save_path: Path) -> Path:
+    """Write inline image data (raw bytes or base64 text) to save_path."""
+    ext = ".png"
+    if mime_type == "image/jpeg":
+        ext = ".jpg"
+    elif mime_type == "image/webp":
+        ext = ".webp"
+
+    if save_path.suffix == "":
+        save_path = save_path.with_suffix(ext)
+
+    if isinstance(image_data, (bytes, bytearray, memoryview)):
+        image_bytes = image_data
+    else:
+        # Strict decode first; only fall back to the forgiving
+        # decoder (which skips stray whitespace) if that fails
+        try:
+            image_bytes = base64.b64decode(image_data, validate=True)
+        except binascii.Error:
+            image_bytes = base64.b64decode(image_data)
+
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path.write_bytes(image_bytes)
+    return save_path
+
+
 def _extract_image(response, save_path: Path) -> Path:
     if response.candidates is None:
         raise RuntimeError("Model returned no candidates (safety filters or model refusal).")
@@ -70,26 +131,7 @@ def _extract_image(response, save_path: Path) -> Path:
         if candidate.content and candidate.content.parts:
             for part in candidate.content.parts:
                 if part.inline_data is not None:
-                    image_data = part.inline_data.data
-                    mime_type = part.inline_data.mime_type
-
-                    ext = ".png"
-                    if mime_type == "image/jpeg":
-                        ext = ".jpg"
-                    elif mime_type == "image/webp":
-                        ext = ".webp"
-
-                    if save_path.suffix == "":
-                        save_path = save_path.with_suffix(ext)
-
-                    if isinstance(image_data, str):
-                        image_bytes = base64.b64decode(image_data)
-                    else:
-                        image_bytes = image_data
-
-                    save_path.parent.mkdir(parents=True, exist_ok=True)
-                    save_path.write_bytes(image_bytes)
-                    return save_path
+                    return _save_inline_image(part.inline_data.data, part.inline_data.mime_type, save_path)
 
     raise RuntimeError("No image found in response")
 
@@ -99,7 +141,7 @@ async def _generate_one(
     index: int,
     prompt: str,
     output_path: Path,
-    input_image: str | None,
+    image_part: types.Part | None,
     aspect_ratio: str,
     image_size: str,
     semaphore: asyncio.Semaphore,
@@ -108,15 +150,15 @@ async def _generate_one(
     async with semaphore:
         try:
             parts: list[types.Part] = []
-            if input_image:
-                parts.append(_load_image_as_part(input_image))
+            if image_part:
+                parts.append(image_part)
             parts.append(types.Part.from_text(text=prompt))
 
             contents = [types.Content(role="user", parts=parts)]
             config = _build_config(aspect_ratio, image_size)
 
             response = await client.aio.models.generate_content(
-                model="gemini-3.1-flash-image-preview",
+                model=MODEL,
                 contents=contents,
                 config=config,
             )
@@ -151,13 +193,20 @@ async def _run_batch(
     image_size: str,
     max_concurrent: int,
 ) -> None:
-    load_dotenv(override=True)
-
     project = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("CLOUDSDK_CORE_PROJECT")
     if not project:
         typer.echo("Error: GOOGLE_CLOUD_PROJECT or CLOUDSDK_CORE_PROJECT env var required", err=True)
         raise typer.Exit(1)
 
+    # Load the shared input image once rather than once per prompt
+    image_part = None
+    if input_image:
+        try:
+            image_part = _load_image_as_part(input_image)
+        except FileNotFoundError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+
     client = genai.Client(vertexai=True, project=project, location="global")
     semaphore = asyncio.Semaphore(max_concurrent)
 
@@ -170,7 +219,7 @@ async def _run_batch(
             index=i,
             prompt=prompt,
             output_path=_resolve_output_path(output_dir, i, prompt),
-            input_image=input_image,
+            image_part=image_part,
             aspect_ratio=aspect_ratio,
             image_size=image_size,
             semaphore=semaphore,
@@ -196,6 +245,162 @@ async def _run_batch(
         raise typer.Exit(1)
 
 
+def _batch_request(
+    key: str,
+    prompt: str,
+    image_part: types.Part | None,
+    aspect_ratio: str,
+    image_size: str,
+) -> dict:
+    """Build one Vertex batch prediction line from the same _build_config as the live path."""
+    parts = []
+    if image_part:
+        parts.append(image_part.model_dump(mode="json", by_alias=True, exclude_none=True))
+    parts.append({"text": prompt})
+
+    # REST keeps safety settings beside generationConfig and nests the image
+    # mime type under imageOutputOptions; everything else serialises as-is
+    generation_config = _build_config(aspect_ratio, image_size).model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    )
+    safety_settings = generation_config.pop("safetySettings", [])
+    image_config = generation_config.get("imageConfig", {})
+    if "outputMimeType" in image_config:
+        image_config["imageOutputOptions"] = {"mimeType": image_config.pop("outputMimeType")}
+
+    return {
+        "key": key,
+        "request": {
+            "contents": [{"role": "user", "parts": parts}],
+            "generationConfig": generation_config,
+            "safetySettings": safety_settings,
+        },
+    }
+
+
+def _prompt_of(line: dict) -> str | None:
+    """Return the text prompt echoed back in a batch output line."""
+    for content in line.get("request", {}).get("contents", []):
+        for part in content.get("parts", []):
+            if "text" in part:
+                return part["text"]
+    return None
+
+
+def generate_images_batch(
+    prompts: list[str],
+    gcs_prefix: str,
+    output_dir: Path | None,
+    input_image: str | None,
+    aspect_ratio: str,
+    image_size: str,
+) -> tuple[int, int]:
+    """Submit all prompts as one Vertex AI batch prediction job.
+
+    Requests are written as JSONL under gcs_prefix, the job's output is read
+    back from the same prefix, and each image is saved like the online path.
+    Returns (succeeded, failed).
+    """
+    from google.cloud import storage
+
+    project = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("CLOUDSDK_CORE_PROJECT")
+    if not project:
+        typer.echo("Error: GOOGLE_CLOUD_PROJECT or CLOUDSDK_CORE_PROJECT env var required", err=True)
+        raise typer.Exit(1)
+    if not gcs_prefix.startswith("gs://"):
+        typer.echo(f"Error: --batch-gcs must be a gs:// URI, got {gcs_prefix}", err=True)
+        raise typer.Exit(1)
+
+    image_part = None
+    if input_image:
+        try:
+            image_part = _load_image_as_part(input_image)
+        except FileNotFoundError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+
+    run_prefix = f"{gcs_prefix.rstrip('/')}/{time.strftime('%Y%m%d-%H%M%S')}"
+    bucket_name, _, blob_prefix = run_prefix[len("gs://"):].partition("/")
+    bucket = storage.Client(project=project).bucket(bucket_name)
+
+    lines = [
+        json.dumps(_batch_request(str(i), prompt, image_part, aspect_ratio, image_size))
+        for i, prompt in enumerate(prompts)
+    ]
+    bucket.blob(f"{blob_prefix}/requests.jsonl").upload_from_string(
+        "\n".join(lines) + "\n", content_type="application/jsonl"
+    )
+
+    client = genai.Client(vertexai=True, project=project, location="global")
+    job = client.batches.create(
+        model=MODEL,
+        src=f"{run_prefix}/requests.jsonl",
+        config=types.CreateBatchJobConfig(dest=f"{run_prefix}/output"),
+    )
+    typer.echo(f"Submitted batch job {job.name} with {len(prompts)} prompt(s); polling...")
+
+    # Batch jobs take minutes to hours, so back off instead of polling at a fixed rate
+    delay = 5.0
+    while job.state is None or job.state.name not in BATCH_DONE_STATES:
+        time.sleep(delay)
+        delay = min(delay * 1.5, 60.0)
+        job = client.batches.get(name=job.name)
+    typer.echo(f"Batch job finished: {job.state.name}\n")
+
+    index_by_key = {str(i): i for i in range(len(prompts))}
+    index_by_prompt = {prompt: i for i, prompt in enumerate(prompts)}
+    done: set[int] = set()
+    failed = 0
+    total = len(prompts)
+
+    for blob in bucket.list_blobs(prefix=f"{blob_prefix}/output/"):
+        if not blob.name.endswith(".jsonl"):
+            continue
+        for raw in blob.download_as_text().splitlines():
+            if not raw.strip():
+                continue
+            line = json.loads(raw)
+            index = index_by_key.get(str(line.get("key")))
+            if index is None:
+                index = index_by_prompt.get(_prompt_of(line))
+            if index is None or index in done:
+                continue
+            done.add(index)
+
+            prompt = prompts[index]
+            short_prompt = prompt[:60] + ("..." if len(prompt) > 60 else "")
+            error = line.get("status") or None
+            inline = None
+            if not error:
+                inline = next(
+                    (
+                        part["inlineData"]
+                        for candidate in line.get("response", {}).get("candidates", [])
+                        for part in candidate.get("content", {}).get("parts", [])
+                        if "inlineData" in part
+                    ),
+                    None,
+                )
+            if inline is None:
+                failed += 1
+                error = error or "No image found in response"
+                typer.echo(f"  FAIL [{index + 1}/{total}] \"{short_prompt}\"\n         {error}", err=True)
+                continue
+
+            path = _save_inline_image(
+                inline["data"],
+                inline.get("mimeType"),
+                _resolve_output_path(output_dir, index, prompt),
+            )
+            typer.echo(f"  OK   [{index + 1}/{total}] \"{short_prompt}\"\n         -> {path}")
+
+    missing = total - len(done)
+    if missing:
+        typer.echo(f"  {missing} prompt(s) had no output in {run_prefix}/output", err=True)
+    failed += missing
+    return total - failed, failed
+
+
 @app.command()
 def generate(
     prompts: list[str] = typer.Argument(default=None, help="One or more text prompts to generate images for."),
@@ -205,6 +410,7 @@ def generate(
     aspect_ratio: str = typer.Option("16:9", "--aspect-ratio", "-a", help="Aspect ratio: 16:9, 1:1, 9:16"),
     image_size: str = typer.Option("2K", "--size", "-s", help="Image size: 1K or 2K"),
     max_concurrent: int = typer.Option(4, "--max-concurrent", "-c", help="Max parallel requests (semaphore limit)."),
+    batch_gcs: str = typer.Option(None, "--batch-gcs", help="Submit as one Vertex AI batch job, staging files under this gs:// prefix."),
 ) -> None:
     """Generate multiple images in parallel using Google Gemini."""
     all_prompts: list[str] = []
@@ -223,6 +429,20 @@ def generate(
         typer.echo("Error: No prompts provided. Pass prompts as arguments or use --from-file.", err=True)
         raise typer.Exit(1)
 
+    if batch_gcs:
+        succeeded, failed = generate_images_batch(
+            prompts=all_prompts,
+            gcs_prefix=batch_gcs,
+            output_dir=output_dir,
+            input_image=input_image,
+            aspect_ratio=aspect_ratio,
+            image_size=image_size,
+        )
+        typer.echo(f"\nDone: {succeeded} succeeded, {failed} failed out of {len(all_prompts)} total.")
+        if failed > 0:
+            raise typer.Exit(1)
+        return
+
     asyncio.run(
         _run_batch(
             prompts=all_prompts,
@@ -7,18 +7,20 @@ Requires: GOOGLE_APPLICATION_CREDENTIALS and GOOGLE_CLOUD_PROJECT env vars.
 """
 
 import argparse
+import functools
+import io
 import os
 import re
+import shutil
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
+from typing import BinaryIO
 
 from dotenv import load_dotenv
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
-from markitdown import MarkItDown
+
+load_dotenv()
 
 
 # Google Workspace MIME types and their export formats
@@ -45,6 +47,39 @@ WORKSPACE_TYPES = {
     },
 }
 
+# File extensions for regular (non-Workspace) files, keyed by MIME type
+MIME_EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": ".pptx",
+    "text/html": ".html",
+    "text/plain": ".txt",
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+}
+
+# Drive URL pattern capturing the file ID from either the path or an id= query parameter
+FILE_ID_PATTERN = re.compile(
+    r"/(?:document|spreadsheets|presentation|file|drawings)/d/([a-zA-Z0-9_-]+)"
+    r"|[?&]id=([a-zA-Z0-9_-]+)"
+)
+FOLDER_ID_PATTERN = re.compile(r"/folders/([a-zA-Z0-9_-]+)")
+
+# Characters not allowed in local file names
+SAFE_NAME_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# Download in large chunks: each chunk is a separate HTTPS request (library default: 100 KiB)
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Buffer size for streaming regular-file downloads straight off the socket
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Uploads at or below this size go in one multipart request; larger ones use a
+# resumable session, sent in UPLOAD_CHUNK_SIZE chunks
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 # Scopes needed for Drive API (read + write)
 SCOPES = [
     "https://www.googleapis.com/auth/drive.readonly",
@@ -52,28 +87,20 @@ SCOPES = [
 ]
 
 
+@functools.lru_cache(maxsize=128)
 def extract_file_id(url_or_id: str) -> str:
     """Extract Google Drive file ID from URL or return as-is if already an ID."""
     if "/" not in url_or_id and len(url_or_id) > 20:
         return url_or_id
 
-    patterns = [
-        r"/document/d/([a-zA-Z0-9_-]+)",
-        r"/spreadsheets/d/([a-zA-Z0-9_-]+)",
-        r"/presentation/d/([a-zA-Z0-9_-]+)",
-        r"/file/d/([a-zA-Z0-9_-]+)",
-        r"/drawings/d/([a-zA-Z0-9_-]+)",
-        r"id=([a-zA-Z0-9_-]+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
-        if match:
-            return match.group(1)
+    match = FILE_ID_PATTERN.search(url_or_id)
+    if match:
+        return match.group(1) or match.group(2)
 
     raise ValueError(f"Could not extract file ID from: {url_or_id}")
 
 
+@functools.lru_cache(maxsize=128)
 def extract_folder_id(url_or_id: str) -> str | None:
     """Extract Google Drive folder ID from URL."""
     if not url_or_id:
@@ -82,26 +109,39 @@ def extract_folder_id(url_or_id: str) -> str | None:
     if "/" not in url_or_id and len(url_or_id) > 20:
         return url_or_id
 
-    match = re.search(r"/folders/([a-zA-Z0-9_-]+)", url_or_id)
+    match = FOLDER_ID_PATTERN.search(url_or_id)
     if match:
         return match.group(1)
 
     return url_or_id
 
 
-def get_drive_service():
-    """Build and return Google Drive API service."""
-    load_dotenv()
-
+@functools.lru_cache(maxsize=1)
+def get_credentials() -> service_account.Credentials:
+    """Load service account credentials (parsed once per process)."""
     creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         raise ValueError("GOOGLE_APPLICATION_CREDENTIALS env var required")
 
-    credentials = service_account.Credentials.from_service_account_file(
+    return service_account.Credentials.from_service_account_file(
         creds_path, scopes=SCOPES
     )
 
-    return build("drive", "v3", credentials=credentials)
+
+@functools.lru_cache(maxsize=1)
+def get_drive_service():
+    """Build and return Google Drive API service (built once per process)."""
+    from googleapiclient.discovery import build
+
+    return build("drive", "v3", credentials=get_credentials(), static_discovery=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_authorized_session():
+    """Return an authorized requests session for raw media downloads (created once per process)."""
+    from google.auth.transport.requests import AuthorizedSession
+
+    return AuthorizedSession(get_credentials())
 
 
 def get_file_info(service, file_id: str) -> dict:
@@ -109,7 +149,7 @@ def get_file_info(service, file_id: str) -> dict:
     try:
         return service.files().get(
             fileId=file_id,
-            fields="id,name,mimeType,owners,shared"
+            fields="id,name,mimeType"
         ).execute()
     except Exception as e:
         error_msg = str(e)
@@ -121,58 +161,73 @@ def get_file_info(service, file_id: str) -> dict:
         raise
 
 
-def export_workspace_file(service, file_id: str, mime_type: str, output_path: Path) -> None:
+def _download(request, fileobj: BinaryIO) -> None:
+    """Run a Drive media request to completion, writing into fileobj."""
+    from googleapiclient.http import MediaIoBaseDownload
+
+    downloader = MediaIoBaseDownload(fileobj, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+    done = False
+    while not done:
+        status, done = downloader.next_chunk()
+        if status:
+            print(f"Download progress: {int(status.progress() * 100)}%", file=sys.stderr)
+
+
+def export_workspace_file(service, file_id: str, mime_type: str, fileobj: BinaryIO) -> None:
     """Export a Google Workspace file to the specified format."""
-    request = service.files().export_media(fileId=file_id, mimeType=mime_type)
+    _download(service.files().export_media(fileId=file_id, mimeType=mime_type), fileobj)
 
-    with open(output_path, "wb") as f:
-        downloader = MediaIoBaseDownload(f, request)
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                print(f"Download progress: {int(status.progress() * 100)}%", file=sys.stderr)
 
+def download_regular_file(service, file_id: str, fileobj: BinaryIO) -> None:
+    """Download a regular (non-Workspace) file from Google Drive.
 
-def download_regular_file(service, file_id: str, output_path: Path) -> None:
-    """Download a regular (non-Workspace) file from Google Drive."""
+    Streams the media response directly into fileobj instead of going through
+    MediaIoBaseDownload's chunked request loop.
+    """
     request = service.files().get_media(fileId=file_id)
+    with get_authorized_session().get(request.uri, stream=True, timeout=300) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        shutil.copyfileobj(resp.raw, fileobj, length=COPY_BUFFER_SIZE)
+
+
+@functools.lru_cache(maxsize=2)
+def get_markitdown(enable_ocr: bool):
+    """Return a shared MarkItDown instance per OCR mode (imported lazily)."""
+    from markitdown import MarkItDown
 
-    with open(output_path, "wb") as f:
-        downloader = MediaIoBaseDownload(f, request)
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                print(f"Download progress: {int(status.progress() * 100)}%", file=sys.stderr)
+    return MarkItDown(enable_vision=enable_ocr)
 
 
-def convert_to_markdown(file_path: Path, enable_ocr: bool = False) -> str:
-    """Convert a file to markdown using markitdown."""
-    md = MarkItDown(enable_vision=enable_ocr)
-    result = md.convert(str(file_path))
+def convert_to_markdown(stream: BinaryIO, extension: str, enable_ocr: bool = False) -> str:
+    """Convert a binary stream to markdown using markitdown."""
+    md = get_markitdown(enable_ocr)
+    result = md.convert_stream(stream, file_extension=extension)
     return result.text_content
 
 
-def markdown_to_docx(md_path: Path, docx_path: Path) -> None:
-    """Convert markdown to docx using pandoc."""
+def markdown_to_docx(md_bytes: bytes) -> bytes:
+    """Convert markdown to docx using pandoc, piping through stdin/stdout."""
     result = subprocess.run(
-        ["pandoc", "-f", "markdown", "-t", "docx", "-o", str(docx_path), str(md_path)],
+        ["pandoc", "-f", "markdown", "-t", "docx", "-o", "-"],
+        input=md_bytes,
         capture_output=True,
-        text=True,
         timeout=60,
     )
     if result.returncode != 0:
-        raise RuntimeError(f"Pandoc failed: {result.stderr}")
+        raise RuntimeError(f"Pandoc failed: {result.stderr.decode(errors='replace')}")
+    return result.stdout
 
 
 def upload_to_gdoc(
     service,
-    file_path: Path,
+    docx_bytes: bytes,
     name: str,
     folder_id: str | None = None,
 ) -> dict:
     """Upload a file to Google Drive and convert to Google Docs format."""
+    from googleapiclient.http import MediaIoBaseUpload
+
     file_metadata = {
         "name": name,
         "mimeType": "application/vnd.google-apps.document",
@@ -181,10 +236,11 @@ def upload_to_gdoc(
     if folder_id:
         file_metadata["parents"] = [folder_id]
 
-    media = MediaFileUpload(
-        str(file_path),
+    media = MediaIoBaseUpload(
+        io.BytesIO(docx_bytes),
         mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        resumable=True,
+        chunksize=UPLOAD_CHUNK_SIZE,
+        resumable=len(docx_bytes) > RESUMABLE_UPLOAD_THRESHOLD,
     )
 
     file = service.files().create(
@@ -225,46 +281,36 @@ def convert_workspace_file(
     print(f"File: {file_name}", file=sys.stderr)
     print(f"Type: {mime_type}", file=sys.stderr)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Handle Google Workspace files (need export)
-        if mime_type in WORKSPACE_TYPES:
-            type_info = WORKSPACE_TYPES[mime_type]
-            print(f"Exporting {type_info['name']} as {type_info['extension']}...", file=sys.stderr)
-
-            export_path = tmpdir_path / f"{file_name}{type_info['extension']}"
-            export_workspace_file(service, file_id, type_info["export_mime"], export_path)
-
-        # Handle regular files (direct download)
-        else:
-            ext_map = {
-                "application/pdf": ".pdf",
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
-                "application/vnd.openxmlformats-officedocument.presentationml.presentation": ".pptx",
-                "text/html": ".html",
-                "text/plain": ".txt",
-                "image/png": ".png",
-                "image/jpeg": ".jpg",
-            }
-            ext = ext_map.get(mime_type, "")
-            if not ext:
-                ext = Path(file_name).suffix or ".bin"
-
-            export_path = tmpdir_path / f"{file_name}{ext if not file_name.endswith(ext) else ''}"
-            print(f"Downloading file...", file=sys.stderr)
-            download_regular_file(service, file_id, export_path)
-
-        # Convert to markdown
-        print("Converting to Markdown...", file=sys.stderr)
-        md_content = convert_to_markdown(export_path, enable_ocr=enable_ocr)
+    # Download into memory and convert from there; no temp file round-trip
+    buf = io.BytesIO()
+
+    # Handle Google Workspace files (need export)
+    if mime_type in WORKSPACE_TYPES:
+        type_info = WORKSPACE_TYPES[mime_type]
+        print(f"Exporting {type_info['name']} as {type_info['extension']}...", file=sys.stderr)
+
+        ext = type_info["extension"]
+        export_workspace_file(service, file_id, type_info["export_mime"], buf)
+
+    # Handle regular files (direct download)
+    else:
+        ext = MIME_EXTENSIONS.get(mime_type, "")
+        if not ext:
+            ext = Path(file_name).suffix.lower() or ".bin"
+
+        print(f"Downloading file...", file=sys.stderr)
+        download_regular_file(service, file_id, buf)
+
+    # Convert to markdown
+    print("Converting to Markdown...", file=sys.stderr)
+    buf.seek(0)
+    md_content = convert_to_markdown(buf, ext, enable_ocr=enable_ocr)
 
     # Determine output path
     if output_path:
         out = Path(output_path)
     else:
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', file_name)
+        safe_name = file_name.translate(SAFE_NAME_TABLE)
         out = Path.cwd() / f"{safe_name}.md"
 
     out.parent.mkdir(parents=True, exist_ok=True)
@@ -301,15 +347,13 @@ def create_gdoc_from_markdown(
 
     service = get_drive_service()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Convert markdown to docx first
-        docx_path = Path(tmpdir) / f"{doc_name}.docx"
-        print("Converting Markdown to DOCX...", file=sys.stderr)
-        markdown_to_docx(md_file, docx_path)
+    # Convert markdown to docx first
+    print("Converting Markdown to DOCX...", file=sys.stderr)
+    docx_bytes = markdown_to_docx(md_file.read_bytes())
 
-        # Upload and convert to Google Doc
-        print("Uploading to Google Drive...", file=sys.stderr)
-        result = upload_to_gdoc(service, docx_path, doc_name, folder_id)
+    # Upload and convert to Google Doc
+    print("Uploading to Google Drive...", file=sys.stderr)
+    result = upload_to_gdoc(service, docx_bytes, doc_name, folder_id)
 
     url = result.get("webViewLink", f"https://docs.google.com/document/d/{result['id']}/edit")
     print(f"Created Google Doc: {url}")
@@ -320,12 +364,19 @@ def list_shared_files(limit: int = 20) -> None:
     """List files accessible to the service account."""
     service = get_drive_service()
 
-    results = service.files().list(
-        pageSize=limit,
-        fields="files(id, name, mimeType, owners)",
-    ).execute()
-
-    files = results.get("files", [])
+    # Drive caps pageSize at 1000; follow nextPageToken only while more are wanted
+    files = []
+    page_token = None
+    while len(files) < limit:
+        results = service.files().list(
+            pageSize=min(limit - len(files), 1000),
+            pageToken=page_token,
+            fields="files(id,name,mimeType),nextPageToken",
+        ).execute()
+        files.extend(results.get("files", []))
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            break
 
     if not files:
         print("No files found. Share files with your service account email to access them.")
@@ -342,14 +393,21 @@ def list_shared_files(limit: int = 20) -> None:
 
 def get_service_account_email() -> str:
     """Get the service account email for sharing instructions."""
-    load_dotenv()
+    # Reuse credentials only if already built; parsing the private key just
+    # for the email is far slower than reading client_email from the file
+    if get_credentials.cache_info().currsize:
+        return get_credentials().service_account_email
+
     creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path:
         return "SERVICE_ACCOUNT_EMAIL"
 
     import json
-    with open(creds_path) as f:
-        creds = json.load(f)
+    try:
+        with open(creds_path) as f:
+            creds = json.load(f)
+    except (OSError, ValueError):
+        return "SERVICE_ACCOUNT_EMAIL"
     return creds.get("client_email", "SERVICE_ACCOUNT_EMAIL")
 
 
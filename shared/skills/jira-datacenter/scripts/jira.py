@@ -9,33 +9,130 @@ Uses Jira REST API v2 for Data Center/Server compatibility.
 import json
 import os
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 import requests
 import typer
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.table import Table
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 app = typer.Typer(help="Jira Data Center CLI")
-console = Console()
+
+# Fields the human-readable views print; requested by default instead of every field
+TABLE_FIELDS = ["summary", "issuetype", "status", "assignee"]
+DETAIL_FIELDS = ["summary", "issuetype", "status", "priority", "assignee", "labels", "description"]
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "jira-cli"
+MAX_WORKERS = 8
+POOL_MAXSIZE = 32
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+    raise_on_status=False,
+)
+
+
+def json_loads(data: bytes | str):
+    """Parse JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize JSON straight to a request body, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the shared Rich console; rich is imported on first output."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _stream_search_page(raw, meta: dict) -> Iterator[dict]:
+    """Yield issues from a streamed search response, recording its total in meta."""
+    builder = None
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "issues.item" and event == "end_map":
+                yield builder.value
+                builder = None
+        elif prefix == "issues.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "total" and event == "number":
+            meta["total"] = value
 
 
 class JiraClient:
     """Jira Data Center API client."""
 
     def __init__(self):
-        load_dotenv()
+        # Agents and CI usually export the settings already; skip the .env lookup then
+        if not os.environ.get("JIRA_BASE_URL"):
+            from dotenv import load_dotenv
+
+            load_dotenv()
 
         self.base_url = os.environ.get("JIRA_BASE_URL", "").rstrip("/")
         if not self.base_url:
             raise typer.BadParameter("JIRA_BASE_URL environment variable required")
 
         self.api_url = f"{self.base_url}/rest/api/2"
+        self._transitions_cache: dict[str, list[dict]] = {}
+        self._transition_ids: dict[str, dict[str, str]] = {}
+        self._projects_cache: list[dict] | None = None
+
+        # Opt-in on-disk cache for GET responses (needs requests-cache); imported
+        # here so the common uncached run does not pay for it at startup
+        self.session = None
+        if os.environ.get("JIRA_CACHE"):
+            try:
+                import requests_cache
+            except ImportError:
+                pass
+            else:
+                self.session = requests_cache.CachedSession(
+                    str(CACHE_DIR / "http_cache"),
+                    backend="sqlite",
+                    expire_after=int(os.environ.get("JIRA_CACHE_TTL", "300")),
+                    allowable_methods=("GET",),
+                )
+        if self.session is None:
+            self.session = requests.Session()
 
         pat = os.environ.get("JIRA_PAT")
         if pat:
-            self.session = requests.Session()
             self.session.headers["Authorization"] = f"Bearer {pat}"
         else:
             username = os.environ.get("JIRA_USERNAME")
@@ -44,35 +141,66 @@ class JiraClient:
                 raise typer.BadParameter(
                     "Set JIRA_PAT or both JIRA_USERNAME and JIRA_PASSWORD"
                 )
-            self.session = requests.Session()
             self.session.auth = (username, password)
 
         self.session.headers["Content-Type"] = "application/json"
         self.session.headers["Accept"] = "application/json"
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> dict | list | None:
-        """Make API request and handle errors."""
+        # Keep connections warm across requests and retry transient failures
+        adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send an API request, exiting with Jira's error message on failure."""
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
 
+        # Encode bodies ourselves; the session already sends Content-Type: application/json
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps_bytes(kwargs.pop("json"))
+
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-
-            if response.status_code == 204:
-                return None
-            return response.json()
+            if method != "GET":
+                self._invalidate(endpoint)
+            return response
 
         except requests.exceptions.HTTPError as e:
             error_msg = str(e)
-            try:
-                error_data = e.response.json()
-                if "errorMessages" in error_data:
-                    error_msg = "; ".join(error_data["errorMessages"])
-                elif "errors" in error_data:
-                    error_msg = "; ".join(f"{k}: {v}" for k, v in error_data["errors"].items())
-            except (ValueError, AttributeError):
-                pass
-            raise typer.Exit(1) from typer.echo(f"Error: {error_msg}", err=True)
+            # Only parse bodies that claim to be JSON; proxies often return HTML error pages
+            if e.response.headers.get("Content-Type", "").startswith("application/json"):
+                try:
+                    error_data = json_loads(e.response.content)
+                    if "errorMessages" in error_data:
+                        error_msg = "; ".join(error_data["errorMessages"])
+                    elif "errors" in error_data:
+                        error_msg = "; ".join(f"{k}: {v}" for k, v in error_data["errors"].items())
+                except (ValueError, AttributeError, TypeError):
+                    pass
+            typer.echo(f"Error: {error_msg}", err=True)
+            raise typer.Exit(1) from None
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop cached GETs for the issue a write just touched."""
+        cache = getattr(self.session, "cache", None)
+        parts = endpoint.strip("/").split("/")
+        if cache is None or len(parts) < 2 or parts[0] != "issue":
+            return
+        prefix = f"{self.api_url}/issue/{parts[1]}"
+        stale = [
+            r.cache_key for r in cache.filter()
+            if r.url == prefix or r.url.startswith((prefix + "/", prefix + "?"))
+        ]
+        if stale:
+            cache.delete(*stale)
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> dict | list | None:
+        """Make API request and handle errors."""
+        response = self._send(method, endpoint, **kwargs)
+        if response.status_code == 204:
+            return None
+        return json_loads(response.content)
 
     def get_issue(self, issue_key: str, fields: list[str] | None = None,
                   expand: list[str] | None = None) -> dict:
@@ -83,6 +211,29 @@ class JiraClient:
             params["expand"] = ",".join(expand)
         return self._request("GET", f"issue/{issue_key}", params=params)
 
+    def get_issues_bulk(self, issue_keys: list[str], fields: list[str] | None = None,
+                        expand: list[str] | None = None,
+                        max_workers: int = MAX_WORKERS) -> tuple[list[dict], list[str]]:
+        """Fetch several issues concurrently, preserving the order of issue_keys.
+
+        Returns (issues, failed_keys); one missing or forbidden key does not
+        discard the others.
+        """
+        if not issue_keys:
+            return [], []
+
+        def fetch(key: str) -> dict | None:
+            try:
+                return self.get_issue(key, fields, expand)
+            except typer.Exit:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(issue_keys))) as executor:
+            results = list(executor.map(fetch, issue_keys))
+        issues = [issue for issue in results if issue is not None]
+        failed = [key for key, issue in zip(issue_keys, results) if issue is None]
+        return issues, failed
+
     def search_issues(self, jql: str, max_results: int = 50,
                       fields: list[str] | None = None) -> dict:
         data = {"jql": jql, "maxResults": max_results}
@@ -90,6 +241,78 @@ class JiraClient:
             data["fields"] = fields
         return self._request("POST", "search", json=data)
 
+    def search_issue_rows(self, jql: str, max_results: int = 50,
+                          fields: list[str] | None = None) -> tuple[int, list[tuple[str, ...]]]:
+        """Search and return (total, table rows), skipping the full decode of each issue."""
+        data = {"jql": jql, "maxResults": max_results}
+        if fields:
+            data["fields"] = fields
+        return search_rows(self._send("POST", "search", json=data).content)
+
+    def search_issues_all(self, jql: str, page_size: int = 100,
+                          fields: list[str] | None = None,
+                          max_workers: int = MAX_WORKERS) -> dict:
+        """Fetch every match for jql, requesting the pages concurrently."""
+        def fetch_page(start_at: int, size: int) -> dict:
+            data = {"jql": jql, "startAt": start_at, "maxResults": size}
+            if fields:
+                data["fields"] = fields
+            return self._request("POST", "search", json=data)
+
+        # The server may cap maxResults below page_size, so step by what page 0 actually held
+        first = fetch_page(0, page_size)
+        total = first.get("total", 0)
+        issues = list(first.get("issues", []))
+        stride = len(issues)
+        starts = list(range(stride, total, stride)) if stride else []
+
+        if starts:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+                # map yields pages in startAt order
+                for page in executor.map(lambda start: fetch_page(start, stride), starts):
+                    issues.extend(page.get("issues", []))
+
+        if len(issues) < total:
+            typer.echo(f"Warning: fetched {len(issues)} of {total} issues; "
+                       "results changed or pages came back short", err=True)
+        return {"startAt": 0, "maxResults": len(issues), "total": total, "issues": issues}
+
+    def iter_search_issues(self, jql: str, limit: int | None = None, page_size: int = 100,
+                           fields: list[str] | None = None) -> Iterator[dict]:
+        """Yield matching issues page by page, holding at most one page at a time.
+
+        With ijson installed each page is parsed incrementally off the socket.
+        Paging stops at the reported total or on an empty page, so a server that
+        caps maxResults below page_size still yields every match.
+        """
+        start_at = 0
+        total = None
+        while (limit is None or start_at < limit) and (total is None or start_at < total):
+            size = page_size if limit is None else min(page_size, limit - start_at)
+            data = {"jql": jql, "startAt": start_at, "maxResults": size}
+            if fields:
+                data["fields"] = fields
+
+            meta: dict = {}
+            count = 0
+            with self._send("POST", "search", json=data, stream=True) as response:
+                if ijson is not None:
+                    response.raw.decode_content = True
+                    page = _stream_search_page(response.raw, meta)
+                else:
+                    body = json_loads(response.content)
+                    meta["total"] = body.get("total")
+                    page = body.get("issues", [])
+                for issue in page:
+                    count += 1
+                    yield issue
+
+            if not count:
+                return
+            if meta.get("total") is not None:
+                total = int(meta["total"])
+            start_at += count
+
     def create_issue(self, project: str, issue_type: str, summary: str,
                      description: str | None = None, priority: str | None = None,
                      assignee: str | None = None, labels: list[str] | None = None,
@@ -121,8 +344,23 @@ class JiraClient:
         self._request("PUT", f"issue/{issue_key}", json=data)
 
     def get_transitions(self, issue_key: str) -> list[dict]:
-        result = self._request("GET", f"issue/{issue_key}/transitions")
-        return result.get("transitions", [])
+        # Transitions depend on the issue's current status, so cache per issue
+        # (not per project) and drop the entry once the issue moves
+        if issue_key not in self._transitions_cache:
+            result = self._request("GET", f"issue/{issue_key}/transitions")
+            self._transitions_cache[issue_key] = result.get("transitions", [])
+        return self._transitions_cache[issue_key]
+
+    def find_transition_id(self, issue_key: str, status: str) -> str | None:
+        """Resolve a transition ID or (case-insensitive) name to its ID."""
+        lookup = self._transition_ids.get(issue_key)
+        if lookup is None:
+            trans = self.get_transitions(issue_key)
+            # Names first so that an exact ID match wins on collision
+            lookup = {t["name"].lower(): t["id"] for t in trans}
+            lookup.update({t["id"]: t["id"] for t in trans})
+            self._transition_ids[issue_key] = lookup
+        return lookup.get(status) or lookup.get(status.lower())
 
     def transition_issue(self, issue_key: str, transition_id: str,
                          comment: str | None = None) -> None:
@@ -130,6 +368,8 @@ class JiraClient:
         if comment:
             data["update"] = {"comment": [{"add": {"body": comment}}]}
         self._request("POST", f"issue/{issue_key}/transitions", json=data)
+        self._transitions_cache.pop(issue_key, None)
+        self._transition_ids.pop(issue_key, None)
 
     def add_comment(self, issue_key: str, body: str) -> dict:
         return self._request("POST", f"issue/{issue_key}/comment", json={"body": body})
@@ -138,63 +378,149 @@ class JiraClient:
         self._request("PUT", f"issue/{issue_key}/assignee", json={"name": username})
 
     def get_projects(self) -> list[dict]:
-        return self._request("GET", "project")
+        if self._projects_cache is None:
+            self._projects_cache = self._request("GET", "project")
+        return self._projects_cache
+
+    def get_project_rows(self) -> list[tuple[str, str]]:
+        """Return (key, name) for every project, reading only those two values."""
+        if self._projects_cache is not None:
+            projects = self._projects_cache
+        else:
+            projects = parse_lazy(self._send("GET", "project").content)
+        return [(p.get("key", ""), p.get("name", "")) for p in projects]
 
 
+@lru_cache(maxsize=1)
 def get_client() -> JiraClient:
+    """Return the shared client, so commands run in one process reuse its session and caches."""
     try:
         return JiraClient()
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
+def invalidate_client() -> None:
+    """Drop the shared client, e.g. after changing JIRA_* settings in-process."""
+    get_client.cache_clear()
+
+
+def split_csv(value: str | None) -> list[str]:
+    """Split a comma-separated option into stripped, de-duplicated, non-empty items."""
+    if not value:
+        return []
+    return list(dict.fromkeys(item for item in map(str.strip, value.split(",")) if item))
+
+
+def nested(d: dict | None, *keys: str, default=""):
+    """Walk keys through nested dicts, returning default on a missing or null value."""
+    for key in keys:
+        if not d:
+            return default
+        d = d.get(key)
+    return default if d is None else d
+
+
+def issue_row(issue) -> tuple[str, ...]:
+    """Pick the table columns out of an issue (a dict or a lazy simdjson object)."""
+    f = issue.get("fields") or {}
+    assignee = f.get("assignee")
+    return (
+        issue.get("key", ""),
+        nested(f, "issuetype", "name"),
+        nested(f, "status", "name"),
+        assignee.get("displayName", "") if assignee else "Unassigned",
+        (f.get("summary") or "")[:50],
+    )
+
+
+def parse_lazy(content: bytes):
+    """Parse a body for read-only access.
+
+    With pysimdjson installed this returns a lazy document, and only the
+    values actually read become Python objects. Fully decoding with
+    simdjson is no faster than orjson or json; the gain is in skipping the
+    fields that are never read.
+    """
+    if simdjson is None:
+        return json_loads(content)
+    return simdjson.Parser().parse(content)
+
+
+def search_rows(content: bytes) -> tuple[int, list[tuple[str, ...]]]:
+    """Extract (total, table rows) from a raw search response."""
+    doc = parse_lazy(content)
+    return doc.get("total", 0), [issue_row(issue) for issue in doc.get("issues", [])]
+
+
+def issues_table(rows: Iterable[tuple[str, ...]]) -> "Table":
+    """Build the summary table shown by search and get-bulk."""
+    from rich.table import Table
+
+    table = Table(show_header=True)
+    table.add_column("Key", style="blue")
+    table.add_column("Type")
+    table.add_column("Status", style="green")
+    table.add_column("Assignee")
+    table.add_column("Summary")
+
+    for row in rows:
+        table.add_row(*row)
+
+    return table
+
+
 @app.command()
 def get(
     issue_key: str = typer.Argument(..., help="Issue key (e.g., PROJ-123)"),
     fields: Optional[str] = typer.Option(None, "--fields", "-f", help="Comma-separated fields"),
     comments: bool = typer.Option(False, "--comments", "-c", help="Include comments"),
+    rendered: bool = typer.Option(False, "--rendered", help="Include HTML-rendered fields (JSON output)"),
     output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
 ):
     """Get issue details by key."""
     client = get_client()
 
-    field_list = fields.split(",") if fields else None
-    expand = ["renderedFields"]
+    field_list = split_csv(fields) or None
+    if field_list is None and not output_json:
+        field_list = DETAIL_FIELDS + (["comment"] if comments else [])
+    # Rendering every text field to HTML is costly server-side and unused by the text view
+    expand = ["renderedFields"] if rendered else []
     if comments:
         expand.append("comments")
 
     issue = client.get_issue(issue_key, fields=field_list, expand=expand)
 
     if output_json:
-        console.print_json(json.dumps(issue))
+        get_console().print_json(data=issue)
         return
 
     f = issue.get("fields", {})
-    console.print(f"\n[bold blue]{issue_key}[/bold blue]: {f.get('summary', 'N/A')}")
-    console.print(f"URL: {client.base_url}/browse/{issue_key}")
-    console.print(f"Type: {f.get('issuetype', {}).get('name', 'N/A')}  "
-                  f"Status: [green]{f.get('status', {}).get('name', 'N/A')}[/green]  "
-                  f"Priority: {f.get('priority', {}).get('name', 'N/A')}")
+    get_console().print(f"\n[bold blue]{issue_key}[/bold blue]: {f.get('summary', 'N/A')}")
+    get_console().print(f"URL: {client.base_url}/browse/{issue_key}")
+    get_console().print(f"Type: {nested(f, 'issuetype', 'name', default='N/A')}  "
+                  f"Status: [green]{nested(f, 'status', 'name', default='N/A')}[/green]  "
+                  f"Priority: {nested(f, 'priority', 'name', default='N/A')}")
 
     assignee = f.get("assignee")
-    console.print(f"Assignee: {assignee.get('displayName') if assignee else 'Unassigned'}")
+    get_console().print(f"Assignee: {assignee.get('displayName') if assignee else 'Unassigned'}")
 
     if f.get("labels"):
-        console.print(f"Labels: {', '.join(f['labels'])}")
+        get_console().print(f"Labels: {', '.join(f['labels'])}")
 
     if f.get("description"):
-        console.print(f"\n[bold]Description:[/bold]\n{f['description']}")
+        get_console().print(f"\n[bold]Description:[/bold]\n{f['description']}")
 
     if comments:
-        comment_list = f.get("comment", {}).get("comments", [])
+        comment_list = nested(f, "comment", "comments", default=[])
         if comment_list:
-            console.print(f"\n[bold]Comments ({len(comment_list)}):[/bold]")
+            get_console().print(f"\n[bold]Comments ({len(comment_list)}):[/bold]")
             for c in comment_list:
-                author = c.get("author", {}).get("displayName", "Unknown")
+                author = nested(c, "author", "displayName", default="Unknown")
                 created = c.get("created", "")[:10]
-                console.print(f"\n[dim]{created}[/dim] [bold]{author}[/bold]:")
-                console.print(c.get("body", ""))
+                get_console().print(f"\n[dim]{created}[/dim] [bold]{author}[/bold]:")
+                get_console().print(c.get("body", ""))
 
 
 @app.command()
@@ -202,42 +528,86 @@ def search(
     jql: str = typer.Argument(..., help="JQL query string"),
     max_results: int = typer.Option(50, "--max", "-m", help="Maximum results"),
     fields: Optional[str] = typer.Option(None, "--fields", "-f", help="Comma-separated fields"),
+    all_fields: bool = typer.Option(False, "--all-fields", help="Return every field (default: only the table fields)"),
+    fetch_all: bool = typer.Option(False, "--all", "-a", help="Fetch all matches, paging concurrently"),
     output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+    stream: bool = typer.Option(False, "--stream", help="Output issues page by page as they arrive"),
 ):
     """Search issues using JQL."""
     client = get_client()
 
-    field_list = fields.split(",") if fields else None
-    results = client.search_issues(jql, max_results=max_results, fields=field_list)
+    field_list = split_csv(fields) or None
+    if field_list is None and not all_fields:
+        field_list = TABLE_FIELDS
+
+    if stream:
+        limit = None if fetch_all else max_results
+        issues = client.iter_search_issues(jql, limit=limit, fields=field_list)
+        if output_json:
+            out = sys.stdout.buffer
+            out.write(b"[")
+            for i, issue in enumerate(issues):
+                if i:
+                    out.write(b",")
+                out.write(json_dumps_bytes(issue))
+            out.write(b"]\n")
+        else:
+            from rich.live import Live
+
+            # Rows appear as each page arrives instead of after the last one
+            table = issues_table([])
+            with Live(table, console=get_console(), refresh_per_second=4):
+                for issue in issues:
+                    table.add_row(*issue_row(issue))
+        return
+
+    if fetch_all:
+        results = client.search_issues_all(jql, fields=field_list)
+    elif output_json:
+        results = client.search_issues(jql, max_results=max_results, fields=field_list)
+    else:
+        # Table-only output: pull just the displayed values out of the response
+        total, rows = client.search_issue_rows(jql, max_results=max_results, fields=field_list)
+        results = None
 
     if output_json:
-        console.print_json(json.dumps(results))
+        get_console().print_json(data=results)
         return
 
-    issues = results.get("issues", [])
-    total = results.get("total", 0)
+    if results is not None:
+        total = results.get("total", 0)
+        rows = [issue_row(issue) for issue in results.get("issues", [])]
 
-    console.print(f"\nFound [bold]{total}[/bold] issues (showing {len(issues)})\n")
+    get_console().print(f"\nFound [bold]{total}[/bold] issues (showing {len(rows)})\n")
+    get_console().print(issues_table(rows))
 
-    table = Table(show_header=True)
-    table.add_column("Key", style="blue")
-    table.add_column("Type")
-    table.add_column("Status", style="green")
-    table.add_column("Assignee")
-    table.add_column("Summary")
 
-    for issue in issues:
-        f = issue.get("fields", {})
-        assignee = f.get("assignee")
-        table.add_row(
-            issue.get("key", ""),
-            f.get("issuetype", {}).get("name", ""),
-            f.get("status", {}).get("name", ""),
-            assignee.get("displayName", "") if assignee else "Unassigned",
-            f.get("summary", "")[:50],
-        )
+@app.command("get-bulk")
+def get_bulk(
+    issue_keys: list[str] = typer.Argument(..., help="Issue keys, comma/space separated, or '-' to read from stdin"),
+    fields: Optional[str] = typer.Option(None, "--fields", "-f", help="Comma-separated fields"),
+    workers: int = typer.Option(MAX_WORKERS, "--workers", "-w", help="Concurrent requests"),
+    output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """Get several issues by key, fetched concurrently."""
+    if issue_keys == ["-"]:
+        issue_keys = sys.stdin.read().split()
+    keys = [k for arg in issue_keys for k in split_csv(arg)]
+
+    client = get_client()
+    field_list = split_csv(fields) or None
+    if field_list is None and not output_json:
+        field_list = TABLE_FIELDS
+    issues, failed = client.get_issues_bulk(keys, fields=field_list, max_workers=max(1, workers))
+
+    if output_json:
+        get_console().print_json(data=issues)
+    else:
+        get_console().print(issues_table(map(issue_row, issues)))
 
-    console.print(table)
+    if failed:
+        typer.echo(f"Failed: {', '.join(failed)}", err=True)
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -255,8 +625,8 @@ def create(
     """Create a new issue."""
     client = get_client()
 
-    label_list = labels.split(",") if labels else None
-    component_list = components.split(",") if components else None
+    label_list = split_csv(labels) or None
+    component_list = split_csv(components) or None
 
     result = client.create_issue(
         project=project,
@@ -270,12 +640,12 @@ def create(
     )
 
     if output_json:
-        console.print_json(json.dumps(result))
+        get_console().print_json(data=result)
         return
 
     key = result.get("key", "")
-    console.print(f"\n[green]Created:[/green] [bold blue]{key}[/bold blue]")
-    console.print(f"URL: {client.base_url}/browse/{key}")
+    get_console().print(f"\n[green]Created:[/green] [bold blue]{key}[/bold blue]")
+    get_console().print(f"URL: {client.base_url}/browse/{key}")
 
 
 @app.command()
@@ -301,20 +671,23 @@ def update(
     if priority:
         fields["priority"] = {"name": priority}
     if labels:
-        fields["labels"] = labels.split(",")
-
-    if add_labels:
-        update_ops["labels"] = [{"add": l} for l in add_labels.split(",")]
-    if remove_labels:
-        update_ops.setdefault("labels", [])
-        update_ops["labels"].extend([{"remove": l} for l in remove_labels.split(",")])
+        # A full replace and incremental ops on the same field conflict in one request
+        fields["labels"] = split_csv(labels)
+        if add_labels or remove_labels:
+            get_console().print("[yellow]Warning:[/yellow] --labels replaces all labels; "
+                                "ignoring --add-labels/--remove-labels")
+    else:
+        label_ops = [{"add": l} for l in split_csv(add_labels)]
+        label_ops += [{"remove": l} for l in split_csv(remove_labels)]
+        if label_ops:
+            update_ops["labels"] = label_ops
 
     client.update_issue(
         issue_key,
         fields=fields if fields else None,
         update=update_ops if update_ops else None
     )
-    console.print(f"[green]Updated:[/green] {issue_key}")
+    get_console().print(f"[green]Updated:[/green] {issue_key}")
 
 
 @app.command()
@@ -327,12 +700,12 @@ def transitions(
     trans = client.get_transitions(issue_key)
 
     if output_json:
-        console.print_json(json.dumps(trans))
+        get_console().print_json(data=trans)
         return
 
-    console.print(f"\nAvailable transitions for [bold blue]{issue_key}[/bold blue]:\n")
+    get_console().print(f"\nAvailable transitions for [bold blue]{issue_key}[/bold blue]:\n")
     for t in trans:
-        console.print(f"  [{t['id']}] {t['name']} -> {t.get('to', {}).get('name', 'N/A')}")
+        get_console().print(f"  [{t['id']}] {t['name']} -> {nested(t, 'to', 'name', default='N/A')}")
 
 
 @app.command()
@@ -343,21 +716,15 @@ def transition(
 ):
     """Transition issue to a new status."""
     client = get_client()
-    trans = client.get_transitions(issue_key)
-
-    transition_id = None
-    for t in trans:
-        if t["id"] == status or t["name"].lower() == status.lower():
-            transition_id = t["id"]
-            break
+    transition_id = client.find_transition_id(issue_key, status)
 
     if not transition_id:
-        available = ", ".join(t["name"] for t in trans)
-        console.print(f"[red]Error:[/red] Transition '{status}' not found. Available: {available}")
+        available = ", ".join(t["name"] for t in client.get_transitions(issue_key))
+        get_console().print(f"[red]Error:[/red] Transition '{status}' not found. Available: {available}")
         raise typer.Exit(1)
 
     client.transition_issue(issue_key, transition_id, comment=comment)
-    console.print(f"[green]Transitioned:[/green] {issue_key} -> {status}")
+    get_console().print(f"[green]Transitioned:[/green] {issue_key} -> {status}")
 
 
 @app.command()
@@ -368,7 +735,7 @@ def comment(
     """Add a comment to an issue."""
     client = get_client()
     client.add_comment(issue_key, body)
-    console.print(f"[green]Added comment to:[/green] {issue_key}")
+    get_console().print(f"[green]Added comment to:[/green] {issue_key}")
 
 
 @app.command()
@@ -382,9 +749,9 @@ def assign(
     client.assign_issue(issue_key, user)
 
     if user:
-        console.print(f"[green]Assigned:[/green] {issue_key} -> {user}")
+        get_console().print(f"[green]Assigned:[/green] {issue_key} -> {user}")
     else:
-        console.print(f"[green]Unassigned:[/green] {issue_key}")
+        get_console().print(f"[green]Unassigned:[/green] {issue_key}")
 
 
 @app.command()
@@ -393,21 +760,22 @@ def projects(
 ):
     """List available projects."""
     client = get_client()
-    proj_list = client.get_projects()
 
     if output_json:
-        console.print_json(json.dumps(proj_list))
+        get_console().print_json(data=client.get_projects())
         return
 
-    console.print("\n[bold]Available projects:[/bold]\n")
+    get_console().print("\n[bold]Available projects:[/bold]\n")
+    from rich.table import Table
+
     table = Table(show_header=True)
     table.add_column("Key", style="blue")
     table.add_column("Name")
 
-    for p in proj_list:
-        table.add_row(p.get("key", ""), p.get("name", ""))
+    for key, name in client.get_project_rows():
+        table.add_row(key, name)
 
-    console.print(table)
+    get_console().print(table)
 
 
 if __name__ == "__main__":